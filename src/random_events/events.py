@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from collections import UserDict
 from typing import TYPE_CHECKING, Iterable
-from typing import Union, Any
+from typing import Union, Any, FrozenSet
 
 import portion
 
-from .variables import Variable, Continuous, Discrete
+from .variables import Variable, Continuous, Discrete, REALS
 
 # Type hinting for Python 3.7 to 3.9
 if TYPE_CHECKING:
@@ -28,10 +28,10 @@ class VariableMap(VariableMapType):
         :param name: The variable's name
         :return: The variable itself
         """
-        variable = [variable for variable in self.keys() if variable.name == name]
-        if len(variable) == 0:
-            raise KeyError(f"Variable {name} not found in event {self}")
-        return variable[0]
+        for variable in self.keys():
+            if variable.name == name:
+                return variable
+        raise KeyError(f"Variable {name} not found in event {self}")
 
     def __getitem__(self, item: Union[str, Variable]):
         if isinstance(item, str):
@@ -68,6 +68,33 @@ class Event(EventMapType):
         if type(self) is not type(other):
             raise TypeError(f"Cannot use operation on {type(self)} with {type(other)}")
 
+    @staticmethod
+    def discrete_universe(variable: Discrete) -> FrozenSet:
+        """
+        Get the set of all values that a discrete variable can take in this kind of event.
+
+        :param variable: The discrete variable
+        :return: The elements of the variable's domain
+        """
+        return variable.domain_set
+
+    @staticmethod
+    def _store_result(result: 'Event', variable: Variable, value: Union[tuple, portion.Interval]):
+        """
+        Store the value of a variable in the result of a set operation.
+
+        The value is already a sorted tuple or an interval of the domain, hence plain events store it without checking
+        it again. Subclasses may check or convert values differently and receive them through `__setitem__`.
+
+        :param result: The event to store the value in
+        :param variable: The variable
+        :param value: The value
+        """
+        if type(result) is Event:
+            result.data[variable] = value
+        else:
+            result[variable] = value
+
     def intersection(self, other: 'Event') -> 'Event':
         """
         Get the intersection of this and another event.
@@ -81,22 +108,26 @@ class Event(EventMapType):
 
         result = self.__class__()
 
-        variables = set(self.keys()) | set(other.keys())
+        variables = self.keys() | other.keys()
 
         for variable in variables:
 
+            # look up both constraints once, None means that the event does not constrain the variable
+            self_value = self.data.get(variable)
+            other_value = other.data.get(variable)
+
             if isinstance(variable, Discrete):
 
                 # get the entire domain
-                value = set(variable.domain)
+                value = self.discrete_universe(variable)
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value &= set(self[variable])
+                if self_value is not None:
+                    value &= set(self_value)
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value &= set(other[variable])
+                if other_value is not None:
+                    value &= set(other_value)
 
                 # convert back to tuple
                 value = tuple(sorted(value))
@@ -108,17 +139,17 @@ class Event(EventMapType):
                 value = variable.domain
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value &= self[variable]
+                if self_value is not None:
+                    value &= self_value
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value &= other[variable]
+                if other_value is not None:
+                    value &= other_value
 
             else:
                 raise TypeError(f"Unknown variable type {type(variable)}")
 
-            result[variable] = value
+            self._store_result(result, variable, value)
 
         return result
 
@@ -136,22 +167,25 @@ class Event(EventMapType):
 
         result = self.__class__()
 
-        variables = set(self.keys()) | set(other.keys())
+        variables = self.keys() | other.keys()
 
         for variable in variables:
 
+            self_value = self.data.get(variable)
+            other_value = other.data.get(variable)
+
             if isinstance(variable, Discrete):
 
                 # get the entire domain
                 value = set()
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value |= set(self[variable])
+                if self_value is not None:
+                    value |= set(self_value)
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value |= set(other[variable])
+                if other_value is not None:
+                    value |= set(other_value)
 
                 # convert back to tuple
                 value = tuple(sorted(value))
@@ -163,17 +197,17 @@ class Event(EventMapType):
                 value = portion.empty()
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value |= self[variable]
+                if self_value is not None:
+                    value |= self_value
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value |= other[variable]
+                if other_value is not None:
+                    value |= other_value
 
             else:
                 raise TypeError(f"Unknown variable type {type(variable)}")
 
-            result[variable] = value
+            self._store_result(result, variable, value)
 
         return result
 
@@ -191,21 +225,24 @@ class Event(EventMapType):
 
         result = self.__class__()
 
-        variables = set(self.keys()) | set(other.keys())
+        variables = self.keys() | other.keys()
 
         for variable in variables:
 
+            self_value = self.data.get(variable)
+            other_value = other.data.get(variable)
+
             if isinstance(variable, Discrete):
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value = set(self[variable])
+                if self_value is not None:
+                    value = set(self_value)
                 else:
-                    value = set(variable.domain)
+                    value = self.discrete_universe(variable)
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value -= set(other[variable])
+                if other_value is not None:
+                    value -= set(other_value)
 
                 # convert back to tuple
                 value = tuple(sorted(value))
@@ -214,19 +251,19 @@ class Event(EventMapType):
             elif isinstance(variable, Continuous):
 
                 # intersect with the constraint of self
-                if variable in self:
-                    value = self[variable]
+                if self_value is not None:
+                    value = self_value
                 else:
-                    value = portion.open(-portion.inf, portion.inf)
+                    value = REALS
 
                 # intersect with the constraint of other
-                if variable in other:
-                    value -= other[variable]
+                if other_value is not None:
+                    value -= other_value
 
             else:
                 raise TypeError(f"Unknown variable type {type(variable)}")
 
-            result[variable] = value
+            self._store_result(result, variable, value)
 
         return result
 
@@ -236,8 +273,26 @@ class Event(EventMapType):
     def complement(self) -> 'Event':
         """
         Get the complement of this event.
+
+        The complement is computed per variable directly, which is equivalent to the difference of the event that
+        contains everything and this event.
         """
-        return self.__class__() - self
+        result = self.__class__()
+
+        for variable, value in self.items():
+
+            if isinstance(variable, Discrete):
+                value = tuple(sorted(self.discrete_universe(variable).difference(value)))
+
+            elif isinstance(variable, Continuous):
+                value = REALS - value
+
+            else:
+                raise TypeError(f"Unknown variable type {type(variable)}")
+
+            self._store_result(result, variable, value)
+
+        return result
 
     __invert__ = complement
     """Alias for complement."""
@@ -250,20 +305,31 @@ class Event(EventMapType):
         default value.
         """
 
-        variables = set(self.keys()) | set(other.keys())
+        if self is other:
+            return True
 
-        equal = True
+        # plain mappings can be compared as well, they are looked up through their own get method
+        other_get = other.data.get if isinstance(other, Event) else other.get
+
+        variables = self.keys() | other.keys()
 
         for variable in variables:
-            if variable in self and variable not in other:
-                value_equal = variable.domain == self[variable]
-            elif variable in other and variable not in self:
-                value_equal = variable.domain == other[variable]
+
+            self_value = self.data.get(variable)
+            other_value = other_get(variable)
+
+            if other_value is None:
+                value_equal = variable.domain == self_value
+            elif self_value is None:
+                value_equal = variable.domain == other_value
             else:
-                value_equal = self[variable] == other[variable]
-            equal &= value_equal
+                value_equal = self_value == other_value
+
+            # stop at the first variable that differs
+            if not value_equal:
+                return False
 
-        return equal
+        return True
 
     @staticmethod
     def check_element(variable: Variable, element: Any) -> Union[tuple, portion.Interval]:
@@ -278,22 +344,31 @@ class Event(EventMapType):
         :return: The wrapped element
         """
 
-        if isinstance(element, Iterable) and not isinstance(element, (str, portion.Interval)):
-            element = tuple(element)
+        # plain numbers and strings are never wrapped, hence they skip the comparably slow isinstance checks
+        if type(element) not in (int, float, str):
 
-        # if the element is already wrapped
-        if isinstance(element, (tuple, portion.Interval)):
+            if isinstance(element, Iterable) and not isinstance(element, (str, portion.Interval)):
+                element = tuple(element)
 
-            # check that the element is in the variable's domain
-            if isinstance(variable, Discrete):
-                if not all(elem in variable.domain for elem in element):
-                    # raise an error
-                    raise ValueError(f"Element {element} not in domain {variable.domain}")
+            # if the element is already wrapped
+            if isinstance(element, (tuple, portion.Interval)):
 
-                element = tuple(sorted(element))
+                # check that the element is in the variable's domain
+                if isinstance(variable, Discrete):
+                    try:
+                        contained = all(elem in variable.domain_set for elem in element)
+                    except TypeError:
+                        # unhashable elements cannot be in the domain
+                        contained = False
 
-            # return the element directly
-            return element
+                    if not contained:
+                        # raise an error
+                        raise ValueError(f"Element {element} not in domain {variable.domain}")
+
+                    element = tuple(sorted(element))
+
+                # return the element directly
+                return element
 
         # if the element is not in the variables' domain
         if element not in variable.domain:
@@ -360,11 +435,22 @@ class EncodedEvent(Event):
             raise ValueError("Element for a discrete domain must be a tuple, not {}".format(type(element)))
 
         # if any element is not in the index set of the domain, raise an error
-        if not all(0 <= elem < len(variable.domain) for elem in element):
+        domain_size = len(variable.domain)
+        if not all(0 <= elem < domain_size for elem in element):
             raise ValueError(f"Element {element} not in the index set of the domain {variable.domain}")
 
         return element
 
+    @staticmethod
+    def discrete_universe(variable: Discrete) -> FrozenSet:
+        """
+        Get the set of all values that a discrete variable can take in this kind of event.
+
+        :param variable: The discrete variable
+        :return: The indices of the variable's domain
+        """
+        return frozenset(range(len(variable.domain)))
+
     def decode(self) -> Event:
         """
         Decode the event to a normal event.
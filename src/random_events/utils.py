@@ -1,3 +1,7 @@
+import functools
+
+
+@functools.lru_cache(maxsize=None)
 def get_full_class_name(cls):
     """
     Returns the full name of a class, including the module name.
@@ -13,4 +17,5 @@ def recursive_subclasses(cls):
     :param cls: The class.
     :return: A list of the classes subclasses.
     """
-    return cls.__subclasses__() + [g for s in cls.__subclasses__() for g in recursive_subclasses(s)]
+    subclasses = cls.__subclasses__()
+    return subclasses + [g for s in subclasses for g in recursive_subclasses(s)]
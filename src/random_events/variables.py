@@ -1,45 +1,101 @@
-from typing import Any, Iterable, Dict, Tuple
+import operator
+import sys
+from typing import Any, Iterable, Dict, List, Tuple, Type, FrozenSet
 
 import portion
 
 from . import utils
 
 
+REALS: portion.Interval = portion.open(-portion.inf, portion.inf)
+"""
+The real line, which is the default domain of continuous variables.
+"""
+
+
+def _get_many(container: Any, keys: Tuple) -> Tuple:
+    """
+    Look up many keys in a container at once, using a C-level itemgetter.
+
+    :param container: The container to look up the keys in
+    :param keys: The keys
+    :return: The values of the keys in the same order
+    """
+    if len(keys) == 0:
+        return ()
+    if len(keys) == 1:
+        return (container[keys[0]],)
+    return operator.itemgetter(*keys)(container)
+
+
 class Variable:
     """
     Abstract base class for all variables.
     """
 
+    __slots__ = ("name", "_domain", "__weakref__")
+
     name: str
     """
     The name of the variable. The name is used for comparison and hashing.
     """
 
-    domain: Any
+    _domain: Any
+
+    _subclasses: Dict[str, Type['Variable']] = {}
     """
-    The set of possible events of the variable.
+    The map from full class names to all subclasses of Variable, used to dispatch from_json.
     """
 
     def __init__(self, name: str, domain: Any):
-        self.name = name
+        # only exact strings can be interned, subclasses of str and other names are kept as they are
+        self.name = sys.intern(name) if type(name) is str else name
         self.domain = domain
 
+    @property
+    def domain(self) -> Any:
+        """
+        The set of possible events of the variable.
+        """
+        return self._domain
+
+    @domain.setter
+    def domain(self, domain: Any):
+        self._domain = domain
+        self._update_domain_caches()
+
+    def _update_domain_caches(self):
+        """
+        Rebuild the data that subclasses derive from the domain.
+        This method is called whenever the domain is set.
+        """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Variable._subclasses[utils.get_full_class_name(cls)] = cls
+
     def __lt__(self, other: "Variable") -> bool:
         """
         Returns True if self < other, False otherwise.
         """
+        if self.name is other.name:
+            return False
         return self.name < other.name
 
     def __gt__(self, other: "Variable") -> bool:
         """
         Returns True if self > other, False otherwise.
         """
+        if self.name is other.name:
+            return False
         return self.name > other.name
 
     def __hash__(self) -> int:
-        return self.name.__hash__()
+        return hash(self.name)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return self.name == other.name and self.domain == other.domain
 
     def __str__(self):
@@ -106,11 +162,12 @@ class Variable:
         :param data: The json dict
         :return: The correct instance of the subclass
         """
-        for subclass in utils.recursive_subclasses(Variable):
-            if utils.get_full_class_name(subclass) == data["type"]:
-                return subclass._from_json(data)
-
-        raise ValueError("Unknown type for variable. Type is {}".format(data["type"]))
+        type_name = data["type"]
+        try:
+            subclass = Variable._subclasses[type_name]
+        except KeyError:
+            raise ValueError("Unknown type for variable. Type is {}".format(type_name)) from None
+        return subclass._from_json(data)
 
 
 class Continuous(Variable):
@@ -118,14 +175,24 @@ class Continuous(Variable):
     Class for real valued random variables.
     """
 
+    __slots__ = ("_domain_data",)
+
     domain: portion.Interval
 
-    def __init__(self, name: str, domain: portion.Interval = portion.open(-portion.inf, portion.inf)):
+    _domain_data: List[Tuple]
+    """
+    The domain in the serialized form of `portion.to_data`.
+    """
+
+    def __init__(self, name: str, domain: portion.Interval = REALS):
         super().__init__(name=name, domain=domain)
 
+    def _update_domain_caches(self):
+        self._domain_data = portion.to_data(self.domain)
+
     def to_json(self) -> Dict[str, Any]:
         return {"name": self.name, "type": utils.get_full_class_name(self.__class__),
-                "domain": portion.to_data(self.domain)}
+                "domain": list(self._domain_data)}
 
     @classmethod
     def _from_json(cls, data: Dict[str, Any]) -> 'Variable':
@@ -136,10 +203,48 @@ class Discrete(Variable):
     """
     Class for discrete countable random variables.
     """
+
+    __slots__ = ("_encoding", "_domain_set")
+
     domain: Tuple
 
+    _encoding: Dict[Any, int]
+    """
+    The map from the elements of the domain to their indices.
+    """
+
+    _domain_set: FrozenSet
+
     def __init__(self, name: str, domain: Iterable):
-        super().__init__(name=name, domain=tuple(sorted(set(domain))))
+
+        # ranges with positive steps are already sorted and unique
+        if isinstance(domain, range) and domain.step > 0:
+            domain = tuple(domain)
+
+        # strictly increasing tuples are already sorted and unique, hence they are kept as they are
+        elif isinstance(domain, tuple) and all(a < b for a, b in zip(domain, domain[1:])):
+            pass
+
+        # sets are already unique and only need sorting
+        elif isinstance(domain, (set, frozenset)):
+            domain = tuple(sorted(domain))
+
+        # everything else is deduplicated and sorted
+        else:
+            domain = tuple(sorted(set(domain)))
+
+        super().__init__(name=name, domain=domain)
+
+    def _update_domain_caches(self):
+        self._encoding = {element: index for index, element in enumerate(self.domain)}
+        self._domain_set = frozenset(self.domain)
+
+    @property
+    def domain_set(self) -> FrozenSet:
+        """
+        The domain as frozenset for fast membership checks and set operations.
+        """
+        return self._domain_set
 
     def encode(self, element: Any) -> int:
         """
@@ -148,7 +253,10 @@ class Discrete(Variable):
         :param element: The element to encode
         :return: The index of the element
         """
-        return self.domain.index(element)
+        try:
+            return self._encoding[element]
+        except (KeyError, TypeError):
+            raise ValueError(f"Element {element} not in domain {self.domain}")
 
     def decode(self, index: int) -> Any:
         """
@@ -166,7 +274,11 @@ class Discrete(Variable):
         :param elements: The elements to encode
         :return: The encoded elements
         """
-        return tuple(map(self.encode, elements))
+        elements = tuple(elements)
+        try:
+            return _get_many(self._encoding, elements)
+        except (KeyError, TypeError):
+            raise ValueError(f"Elements {elements} not in domain {self.domain}")
 
     def decode_many(self, elements: Iterable[int]) -> Iterable[Any]:
         """
@@ -175,16 +287,18 @@ class Discrete(Variable):
         :param elements: The encoded elements
         :return: The decoded elements
         """
-        return tuple(map(self.decode, elements))
+        return _get_many(self.domain, tuple(elements))
 
 
 class Symbolic(Discrete):
     """
     Class for unordered, finite, discrete random variables.
     """
-    ...
+
+    __slots__ = ()
 
 
 class Integer(Discrete):
     """Class for ordered, discrete random variables."""
-    ...
+
+    __slots__ = ()
@@ -5,6 +5,16 @@ import portion
 from random_events.events import VariableMap, Event, EncodedEvent
 from random_events.variables import Continuous, Integer, Symbolic
 
+# the tests never modify the variables, hence all test cases share the same instances
+_INTEGER = Integer("integer", frozenset(range(10)))
+_SYMBOL = Symbolic("symbol", frozenset(("a", "b", "c")))
+_REAL = Continuous("real")
+
+# intervals are immutable, hence they are shared as well
+_OPEN_UNIT_INTERVAL = portion.open(0, 1)
+_CLOSED_UNIT_INTERVAL = portion.closed(0.0, 1.0)
+_SINGLETON_ONE = portion.singleton(1.0)
+
 
 class VariableTestCase(unittest.TestCase):
 
@@ -18,9 +28,9 @@ class VariableTestCase(unittest.TestCase):
         """
         Create some event for testing.
         """
-        cls.integer = Integer("integer", set(range(10)))
-        cls.symbol = Symbolic("symbol", {"a", "b", "c"})
-        cls.real = Continuous("real")
+        cls.integer = _INTEGER
+        cls.symbol = _SYMBOL
+        cls.real = _REAL
         cls.event = VariableMap({cls.integer: 1, cls.symbol: "a", cls.real: 1.0})
 
     def test_creation(self):
@@ -53,16 +63,18 @@ class EventTestCase(unittest.TestCase):
     symbol: Symbolic
     real: Continuous
     event: Event
+    real_complement: portion.Interval
 
     @classmethod
     def setUpClass(cls):
         """
         Create some event for testing.
         """
-        cls.integer = Integer("integer", set(range(10)))
-        cls.symbol = Symbolic("symbol", {"a", "b", "c"})
-        cls.real = Continuous("real")
+        cls.integer = _INTEGER
+        cls.symbol = _SYMBOL
+        cls.real = _REAL
         cls.event = Event({cls.integer: 1, cls.symbol: "a", cls.real: 1.0})
+        cls.real_complement = portion.open(-portion.inf, portion.inf) - cls.event["real"]
 
     def test_wrapping(self):
         """
@@ -70,36 +82,29 @@ class EventTestCase(unittest.TestCase):
         """
         self.assertEqual(self.event[self.integer], (1,))
         self.assertEqual(self.event[self.symbol], ("a",))
-        self.assertEqual(self.event[self.real], portion.singleton(1.0))
+        self.assertEqual(self.event[self.real], _SINGLETON_ONE)
 
     def test_set_assignment(self):
         """
         Test that the event is set correctly.
         """
-        event = self.event.copy()
+        event = Event({self.integer: 1, self.symbol: "a", self.real: 1.0})
         event[self.integer] = (2, 3)
         self.assertEqual(event[self.integer], (2, 3))
         event[self.symbol] = ("b", "c")
         self.assertEqual(event[self.symbol], ("b", "c"))
-        event[self.real] = portion.closed(0.0, 1.0)
-        self.assertEqual(event[self.real], portion.closed(0.0, 1.0))
+        event[self.real] = _CLOSED_UNIT_INTERVAL
+        self.assertEqual(event[self.real], _CLOSED_UNIT_INTERVAL)
 
     def test_raising(self):
         """
         Test that errors are raised correctly.
         """
-        event = self.event.copy()
-        with self.assertRaises(ValueError):
-            event[self.integer] = 11
-
-        with self.assertRaises(ValueError):
-            event[self.integer] = (-1,)
-
-        with self.assertRaises(ValueError):
-            event[self.symbol] = "d"
-
-        with self.assertRaises(ValueError):
-            event[self.symbol] = ("d",)
+        event = Event()
+        for variable, value in [(self.integer, 11), (self.integer, (-1,)), (self.symbol, "d"), (self.symbol, ("d",)),
+                                (self.symbol, [["a"]])]:
+            with self.subTest(variable=variable, value=value), self.assertRaises(ValueError):
+                event[variable] = value
 
     def test_encode(self):
         """
@@ -170,7 +175,7 @@ class EventTestCase(unittest.TestCase):
         result = event_1.difference(self.event)
         self.assertEqual(result["integer"], (2, 5))
         self.assertEqual(result["symbol"], ("b", ))
-        self.assertEqual(result["real"], portion.open(-portion.inf, portion.inf) - self.event["real"])
+        self.assertEqual(result["real"], self.real_complement)
 
     def test_difference_alias(self):
         event_1 = Event()
@@ -180,9 +185,18 @@ class EventTestCase(unittest.TestCase):
         # differences are not symmetric
         self.assertNotEqual(event_1 - self.event, self.event - event_1)
 
+    def test_complement(self):
+        complement = self.event.complement()
+        self.assertEqual(complement["integer"], (0, 2, 3, 4, 5, 6, 7, 8, 9))
+        self.assertEqual(complement["symbol"], ("b", "c"))
+        self.assertEqual(complement["real"], self.real_complement)
+        self.assertEqual(complement, Event() - self.event)
+        self.assertEqual(~self.event, complement)
+
     def test_equality(self):
         self.assertEqual(self.event, self.event)
         self.assertNotEqual(self.event, Event())
+        self.assertEqual(self.event, dict(self.event))
 
     def test_raises_on_operation_with_different_types(self):
         with self.assertRaises(TypeError):
@@ -206,9 +220,9 @@ class EncodedEventTestCase(unittest.TestCase):
         """
         Create some event for testing.
         """
-        cls.integer = Integer("integer", set(range(10)))
-        cls.symbol = Symbolic("symbol", {"a", "b", "c"})
-        cls.real = Continuous("real")
+        cls.integer = _INTEGER
+        cls.symbol = _SYMBOL
+        cls.real = _REAL
 
     def test_creation(self):
         event = EncodedEvent()
@@ -221,20 +235,14 @@ class EncodedEventTestCase(unittest.TestCase):
         event[self.symbol] = {1, 0}
         self.assertEqual(event[self.symbol], (0, 1))
 
-        interval = portion.open(0, 1)
-        event[self.real] = interval
-        self.assertEqual(interval, event[self.real])
+        event[self.real] = _OPEN_UNIT_INTERVAL
+        self.assertEqual(_OPEN_UNIT_INTERVAL, event[self.real])
 
     def test_raises(self):
         event = EncodedEvent()
-        with self.assertRaises(ValueError):
-            event[self.symbol] = 3
-
-        with self.assertRaises(ValueError):
-            event[self.symbol] = portion.open(0, 1)
-
-        with self.assertRaises(ValueError):
-            event[self.symbol] = (1, 2, 3, 4)
+        for value in [3, _OPEN_UNIT_INTERVAL, (1, 2, 3, 4)]:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                event[self.symbol] = value
 
     def test_dict_like_creation(self):
         event = EncodedEvent(zip([self.integer, self.symbol], [1, 0]))
@@ -251,6 +259,18 @@ class EncodedEventTestCase(unittest.TestCase):
         self.assertEqual(type(event | event), EncodedEvent)
         self.assertEqual(type(event - event), EncodedEvent)
 
+    def test_set_operations_check_indices(self):
+        integer = Integer("integer", range(5, 10))
+        with self.assertRaises(ValueError):
+            EncodedEvent({self.symbol: 0}) - EncodedEvent({integer: 7})
+
+    def test_set_operations_on_indices(self):
+        integer = Integer("integer", range(5, 10))
+        event = EncodedEvent({integer: (0, 1)})
+        self.assertEqual((event & EncodedEvent({integer: (1, 2)}))[integer], (1,))
+        self.assertEqual((EncodedEvent({self.symbol: 0}) - EncodedEvent({integer: 1}))[integer], (0, 2, 3, 4))
+        self.assertEqual((~event)[integer], (2, 3, 4))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from random_events.utils import get_full_class_name, recursive_subclasses
+
+
+class UtilsTestCase(unittest.TestCase):
+    """Tests for `utils.py`."""
+
+    def test_get_full_class_name(self):
+        self.assertEqual(get_full_class_name(UtilsTestCase), __name__ + ".UtilsTestCase")
+
+    def test_recursive_subclasses(self):
+        """
+        Test that direct subclasses come first, followed by the descendants of each subclass in turn.
+        """
+
+        class A:
+            pass
+
+        class B(A):
+            pass
+
+        class C(A):
+            pass
+
+        class D(B):
+            pass
+
+        class E(C):
+            pass
+
+        class F(D):
+            pass
+
+        self.assertEqual(recursive_subclasses(A), [B, C, D, F, E])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import weakref
 
 import portion
 
@@ -17,8 +18,8 @@ class VariablesTestCase(unittest.TestCase):
         """
         Create some variables for testing.
         """
-        cls.integer = Integer("integer", set(range(10)))
-        cls.symbol = Symbolic("symbol", {"a", "b", "c"})
+        cls.integer = Integer("integer", frozenset(range(10)))
+        cls.symbol = Symbolic("symbol", frozenset(("a", "b", "c")))
         cls.real = Continuous("real")
 
     def test_creation(self):
@@ -32,6 +33,51 @@ class VariablesTestCase(unittest.TestCase):
         self.assertEqual(self.real.name, "real")
         self.assertEqual(self.real.domain, portion.open(-portion.inf, portion.inf))
 
+    def test_name_types(self):
+        """
+        Test that names do not have to be exact strings.
+        """
+
+        class Name(str):
+            pass
+
+        self.assertEqual(Continuous(Name("real")).name, "real")
+        self.assertEqual(Continuous(3).name, 3)
+
+    def test_domain_normalization(self):
+        """
+        Test that discrete domains are sorted and unique regardless of the input.
+        """
+        self.assertEqual(Integer("integer", range(3)).domain, (0, 1, 2))
+        self.assertEqual(Integer("integer", range(2, -1, -1)).domain, (0, 1, 2))
+        self.assertEqual(Integer("integer", (0, 1, 2)).domain, (0, 1, 2))
+        self.assertEqual(Integer("integer", (2, 0, 1, 0)).domain, (0, 1, 2))
+        self.assertEqual(Symbolic("symbol", ["c", "a", "b", "a"]).domain, ("a", "b", "c"))
+        self.assertEqual(Symbolic("symbol", frozenset(("c", "a", "b"))).domain, ("a", "b", "c"))
+
+    def test_domain_reassignment(self):
+        """
+        Test that a reassigned domain is used for serialization and encoding.
+        """
+        real = Continuous("real")
+        real.domain = portion.closed(0, 2)
+        self.assertEqual(Variable.from_json(real.to_json()).domain, portion.closed(0, 2))
+
+        symbol = Symbolic("symbol", ("a", "b"))
+        symbol.domain = ("a", "b", "c")
+        self.assertEqual(symbol.encode("c"), 2)
+
+    def test_slots(self):
+        """
+        Test that variables store their attributes in slots instead of a dict and can still be weakly referenced.
+        """
+        self.assertFalse(hasattr(self.real, "__dict__"))
+        self.assertFalse(hasattr(self.integer, "__dict__"))
+        self.assertFalse(hasattr(self.symbol, "__dict__"))
+        self.assertIs(weakref.ref(self.real)(), self.real)
+        self.assertIs(weakref.ref(self.integer)(), self.integer)
+        self.assertIs(weakref.ref(self.symbol)(), self.symbol)
+
     def test_hash(self):
         """
         Test that the variables are hashable.
@@ -73,6 +119,21 @@ class VariablesTestCase(unittest.TestCase):
         self.assertEqual(self.integer.encode(1), 1)
         self.assertEqual(self.symbol.encode("b"), 1)
         self.assertEqual(self.real.encode(1.0), 1.0)
+        with self.assertRaises(ValueError):
+            self.symbol.encode("d")
+        with self.assertRaises(ValueError):
+            self.symbol.encode(["a"])
+
+    def test_encode_many(self):
+        """
+        Test that many elements can be encoded and decoded at once.
+        """
+        self.assertEqual(self.symbol.encode_many(("a", "c")), (0, 2))
+        self.assertEqual(self.symbol.decode_many((0, 2)), ("a", "c"))
+        with self.assertRaises(ValueError):
+            self.symbol.encode_many(("a", "d"))
+        with self.assertRaises(ValueError):
+            self.symbol.encode_many(("a", ["b"]))
 
     def test_decode(self):
         """
@@ -92,6 +153,9 @@ class VariablesTestCase(unittest.TestCase):
         symbol = Variable.from_json(self.symbol.to_json())
         self.assertEqual(symbol, self.symbol)
 
+        with self.assertRaises(ValueError):
+            Variable.from_json({"name": "unknown", "type": "unknown.Unknown", "domain": None})
+
 
 if __name__ == '__main__':
     unittest.main()